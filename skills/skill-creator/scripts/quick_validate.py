@@ -9,6 +9,12 @@ import re
 import yaml
 from pathlib import Path
 
+FRONTMATTER_RE = re.compile(r'^---\n(.*?)\n---', re.DOTALL)
+NAME_RE = re.compile(r'^[a-z0-9-]+$')
+
+# Allowed top-level frontmatter properties
+ALLOWED_PROPERTIES = frozenset({'name', 'description', 'license', 'allowed-tools', 'metadata'})
+
 def validate_skill(skill_path):
     """Basic validation of a skill"""
     skill_path = Path(skill_path)
@@ -24,7 +30,7 @@ def validate_skill(skill_path):
         return False, "No YAML frontmatter found"
 
     # Extract frontmatter
-    match = re.match(r'^---\n(.*?)\n---', content, re.DOTALL)
+    match = FRONTMATTER_RE.match(content)
     if not match:
         return False, "Invalid frontmatter format"
 
@@ -38,9 +44,6 @@ def validate_skill(skill_path):
     except yaml.YAMLError as e:
         return False, f"Invalid YAML in frontmatter: {e}"
 
-    # Define allowed properties
-    ALLOWED_PROPERTIES = {'name', 'description', 'license', 'allowed-tools', 'metadata'}
-
     # Check for unexpected properties (excluding nested keys under metadata)
     unexpected_keys = set(frontmatter.keys()) - ALLOWED_PROPERTIES
     if unexpected_keys:
@@ -62,7 +65,7 @@ def validate_skill(skill_path):
     name = name.strip()
     if name:
         # Check naming convention (hyphen-case: lowercase with hyphens)
-        if not re.match(r'^[a-z0-9-]+$', name):
+        if not NAME_RE.match(name):
             return False, f"Name '{name}' should be hyphen-case (lowercase letters, digits, and hyphens only)"
         if name.startswith('-') or name.endswith('-') or '--' in name:
             return False, f"Name '{name}' cannot start/end with hyphen or contain consecutive hyphens"